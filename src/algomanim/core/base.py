@@ -10,12 +10,31 @@ Manim use notes:
     for unknown reason (artifacts are located in mn.ORIGIN)
 """
 
+from functools import lru_cache
+
 import numpy as np
 import manim as mn
 
 from algomanim.core.paths.hl_rect import HLRect
 
 
+@lru_cache(maxsize=512)
+def _build_text(text: str, config: tuple) -> mn.Text:
+    """Build and memoize a text mobject.
+
+    Cached instances are templates only and must never be added to a scene,
+    use `AlgoManimBase._create_text()` to get an independent copy.
+
+    Args:
+        text: The text string to render.
+        config: Sorted tuple of `mn.Text` keyword argument items.
+
+    Returns:
+        Text mobject shared between all callers with the same key.
+    """
+    return mn.Text(text, **dict(config))
+
+
 class AlgoManimBase(mn.VGroup):
     """Base class for all algomanim classes.
 
@@ -355,6 +374,29 @@ class AlgoManimBase(mn.VGroup):
         # readd object to make it above the glow
         scene.add(self)
 
+    @staticmethod
+    def _create_text(text: str, **config) -> mn.Text:
+        """Create a text mobject, reusing previously rendered glyphs.
+
+        Pango/SVG glyph rendering dominates construction time, while the same
+        strings (digits, letters, quotes, labels) are rendered over and over.
+        Identical requests are served by copying a cached template instead.
+        Falls back to a plain `mn.Text` when config values are unhashable
+        (e.g. gradient color lists).
+
+        Args:
+            text: The text string to render.
+            **config: Keyword arguments passed to `mn.Text`.
+
+        Returns:
+            New text mobject, independent from the cache.
+        """
+        try:
+            template = _build_text(text, tuple(sorted(config.items())))
+        except TypeError:
+            return mn.Text(text, **config)
+        return template.copy()
+
     @staticmethod
     def _clear_scene(scene):
         """Remove empty utility mobjects from the scene.
@@ -1,5 +1,6 @@
 import manim as mn
 import re
+from functools import lru_cache
 from manim import ManimColor
 
 from algomanim.core.paths.semi_rounded_rectangle import SemiRoundedRectangle
@@ -7,6 +8,43 @@ from algomanim.helpers.parsing import code_to_lines
 
 from .base import AlgoManimBase
 
+_INLINE_CMD_RE = re.compile(r"=[^\s]+$")
+
+
+@lru_cache(maxsize=128)
+def _format_code_lines_cached(code: str) -> tuple[str, ...]:
+    """Memoized implementation of `CodeBlockBase._format_code_lines()`.
+
+    Returns a tuple so the cached value can't be mutated by callers.
+    """
+    lines = code_to_lines(code)
+    res = []
+    for line in lines:
+        stripped = line.lstrip()
+        indent = len(line) - len(stripped)
+        line = "│   " * (indent // 4) + stripped
+
+        if _INLINE_CMD_RE.search(line):
+            line = line.rsplit(" ", 1)[0]
+
+        res.append(line)
+
+    return tuple(res)
+
+
+@lru_cache(maxsize=None)
+def _line_glyph_height(font: str, font_size: float) -> float:
+    """Measure and memoize the height of the '│' line glyph.
+
+    Args:
+        font: Font family.
+        font_size: Font size.
+
+    Returns:
+        Height of the rendered glyph.
+    """
+    return mn.Text("│", font=font, font_size=font_size).height
+
 
 class CodeBlockBase(AlgoManimBase):
     """Base class for Code Blocks.
@@ -171,16 +209,17 @@ class CodeBlockBase(AlgoManimBase):
     def _find_max_line_width(self) -> float:
         """Find the maximum width among all line VGroups.
 
+        Each line's text is centered inside a wider rectangle, so the
+        rectangle defines the line width and glyph points are never scanned.
+
         Returns:
             Maximum line width in units.
         """
-        lines_width_list = []
-
-        for group in (self._code_line_vgroups, self._head_line_vgroups):
-            width_list = [mob.width for mob in group]
-            lines_width_list += width_list
-
-        return max(lines_width_list)
+        return max(
+            rect.width
+            for group in (self._code_rect_mobs, self._head_rect_mobs)
+            for rect in group
+        )
 
     def _find_code_vgroup_height(self) -> float:
         """Calculate the height of the code VGroup.
@@ -215,12 +254,7 @@ class CodeBlockBase(AlgoManimBase):
         Returns:
             Height based on font size and line spacing buffer.
         """
-        spec_mob = mn.Text(
-            "│",
-            font=self._font,
-            font_size=self._font_size,
-        )
-        return spec_mob.height + self._code_buff
+        return _line_glyph_height(self._font, self._font_size) + self._code_buff
 
     def _create_text_mobs(
         self,
@@ -233,7 +267,7 @@ class CodeBlockBase(AlgoManimBase):
             List of text mobjects.
         """
         text_mobs = [
-            mn.Text(
+            self._create_text(
                 line,
                 font=self._font,
                 font_size=self._font_size,
@@ -387,7 +421,8 @@ class CodeBlockBase(AlgoManimBase):
 
         Strips trailing inline commands (patterns ending with '=.' followed by
         command characters) used by create_animation_template_sound() for
-        generating animation scaffolding with sound blocks.
+        generating animation scaffolding with sound blocks. Results are cached
+        per code string.
 
         Args:
             code: Multiline code string.
@@ -396,16 +431,4 @@ class CodeBlockBase(AlgoManimBase):
             list[str]: Lines formatted with '│   ' prefixes
               for indentation levels and stripped of inline commands.
         """
-        lines = code_to_lines(code)
-        res = []
-        for line in lines:
-            indent = len(line) - len(line.lstrip())
-            prefix = "│   " * (indent // 4)
-            line = prefix + line.lstrip()
-
-            if re.search(r"=[^\s]+$", line):
-                line = line.rsplit(" ", 1)[0]
-
-            res.append(line)
-
-        return res
+        return list(_format_code_lines_cached(code))
@@ -75,7 +75,7 @@ class LinearContainerStructure(AlgoManimBase):
         fill_color: ManimColor | str = mn.GRAY,
         bg_color: ManimColor | str = mn.DARK_GRAY,
         # ---- value colors mode ----
-        value_colors_map: dict[Any, list[ManimColor | str]] = {},
+        value_colors_map: dict[Any, list[ManimColor | str]] | None = None,
         # ---- highlight containers colors ----
         color_containers_with_value: ManimColor | str = mn.BLACK,
         color_1: ManimColor | str = COLORS.color_1,
@@ -119,7 +119,7 @@ class LinearContainerStructure(AlgoManimBase):
         self._bottom_pointers_colors: dict[int, list[ManimColor | str]] = {}
 
         # ---- value colors mode ----
-        self._value_colors_map = value_colors_map
+        self._value_colors_map = value_colors_map or {}
 
         # ---- font ----
         self._font = font
@@ -202,31 +202,50 @@ class LinearContainerStructure(AlgoManimBase):
 
     def activate_value_colors_mode(
         self,
-        value_colors_map: dict[Any, list[ManimColor | str]] = {},
+        value_colors_map: dict[Any, list[ManimColor | str]] | None = None,
     ) -> None:
         """Activate value-based coloring mode with the given mapping.
 
         Args:
             value_colors_map: Dictionary mapping values to [container_color, text_color].
         """
-        self._value_colors_map = value_colors_map
+        self._value_colors_map = value_colors_map or {}
 
     def deactivate_value_colors_mode(self) -> None:
         """Deactivate value-based coloring mode.
 
         Resets `_value_colors_map` to empty, reverting to default highlighting.
+        Containers and texts painted by value are repainted right away, so
+        later partial repaints start from the index-based colors.
         """
+        value_colors_map = self._value_colors_map
         self._value_colors_map = {}
 
-    def _apply_containers_colors(self) -> None:
+        if self._data:
+            for i, val in enumerate(self._data):
+                if val in value_colors_map:
+                    self._values_mob[i].set_color(self._text_color)
+        self._apply_containers_colors()
+
+    def _apply_containers_colors(self, indices: Collection[int] | None = None) -> None:
         """Apply stored index-based highlight colors to container objects.
 
         Skips execution when value-based coloring mode is active.
+
+        Args:
+            indices: Containers to repaint. If None, repaints all containers.
+                Out of range indices are ignored.
         """
         if self._value_colors_map:
             return
 
-        for i, mob in enumerate(self._containers_mob):
+        if indices is None:
+            indices = range(len(self._containers_mob))
+
+        for i in indices:
+            if not 0 <= i < len(self._containers_mob):
+                continue
+            mob = self._containers_mob[i]
             if i in self._containers_colors:
                 if self._data:
                     mob.set_fill(self._containers_colors[i])
@@ -235,6 +254,31 @@ class LinearContainerStructure(AlgoManimBase):
             else:
                 mob.set_fill(self._fill_color)
 
+    @staticmethod
+    def _changed_color_keys(old: Mapping, new: Mapping) -> set:
+        """Return keys whose stored color differs between two color dicts.
+
+        Colors of different types (hex string vs ManimColor) are treated as
+        changed, so the comparison never depends on cross-type equality.
+
+        Args:
+            old: Previous index -> color mapping.
+            new: Current index -> color mapping.
+
+        Returns:
+            Keys missing from either mapping or mapped to a different color.
+        """
+        changed = set()
+        for key in old.keys() | new.keys():
+            if key not in old or key not in new:
+                changed.add(key)
+                continue
+            a, b = old[key], new[key]
+            if a is b or (type(a) is type(b) and a == b):
+                continue
+            changed.add(key)
+        return changed
+
     def _apply_pointers_colors(self, pos: int):
         """Apply stored color highlights to pointer objects at the specified position.
 
@@ -326,11 +370,12 @@ class LinearContainerStructure(AlgoManimBase):
                 .scale(0.1)
                 .rotate(mn.PI)
             )
+            # create top triangles (3 per cell), arranged once
+            top_triple_template = mn.VGroup(
+                *[top_triangle.copy() for _ in range(3)]
+            ).arrange(mn.RIGHT, buff=0.08)
             for cell in cell_mob:
-                # create top triangles (3 per cell)
-                top_triple_group = mn.VGroup(*[top_triangle.copy() for _ in range(3)])
-                # arrange top triangles horizontally above the cell
-                top_triple_group.arrange(mn.RIGHT, buff=0.08)
+                top_triple_group = top_triple_template.copy()
                 top_triple_group.next_to(cell, mn.UP, buff=0.15)
                 pointers_top.add(top_triple_group)
 
@@ -341,11 +386,12 @@ class LinearContainerStructure(AlgoManimBase):
                 .scale(0.1)
                 .rotate(mn.PI)
             )
+            # create top triangles (5 per cell), arranged once
+            top_triple_template = mn.VGroup(
+                *[top_triangle.copy() for _ in range(5)]
+            ).arrange(mn.RIGHT, buff=0.05)
             for cell in cell_mob:
-                # create top triangles (5 per cell)
-                top_triple_group = mn.VGroup(*[top_triangle.copy() for _ in range(5)])
-                # arrange top triangles horizontally above the cell
-                top_triple_group.arrange(mn.RIGHT, buff=0.05)
+                top_triple_group = top_triple_template.copy()
                 top_triple_group.next_to(cell, mn.UP, buff=0.15)
                 pointers_top.add(top_triple_group)
 
@@ -364,25 +410,24 @@ class LinearContainerStructure(AlgoManimBase):
             bottom_triangle = (
                 mn.Triangle(color=self._bg_color).stretch_to_fit_width(0.7).scale(0.1)
             )
-
+            # create bottom triangles (3 per cell), arranged once
+            bottom_triple_template = mn.VGroup(
+                *[bottom_triangle.copy() for _ in range(3)]
+            ).arrange(mn.RIGHT, buff=0.08)
             for cell in cell_mob:
-                # create bottom triangles (3 per cell)
-                bottom_triple_group = mn.VGroup(
-                    *[bottom_triangle.copy() for _ in range(3)]
-                )
-                bottom_triple_group.arrange(mn.RIGHT, buff=0.08)
+                bottom_triple_group = bottom_triple_template.copy()
                 bottom_triple_group.next_to(cell, mn.DOWN, buff=0.15)
                 pointers_bottom.add(bottom_triple_group)
         elif self._pointers_mode == 5:
             bottom_triangle = (
                 mn.Triangle(color=self._bg_color).stretch_to_fit_width(0.5).scale(0.1)
             )
+            # create bottom triangles (5 per cell), arranged once
+            bottom_triple_template = mn.VGroup(
+                *[bottom_triangle.copy() for _ in range(5)]
+            ).arrange(mn.RIGHT, buff=0.05)
             for cell in cell_mob:
-                # create bottom triangles (5 per cell)
-                bottom_triple_group = mn.VGroup(
-                    *[bottom_triangle.copy() for _ in range(5)]
-                )
-                bottom_triple_group.arrange(mn.RIGHT, buff=0.05)
+                bottom_triple_group = bottom_triple_template.copy()
                 bottom_triple_group.next_to(cell, mn.DOWN, buff=0.15)
                 pointers_bottom.add(bottom_triple_group)
 
@@ -596,6 +641,7 @@ class LinearContainerStructure(AlgoManimBase):
                 colors[i] = getattr(self, f"_color_{i + 1}")
 
         # --- clear previous highlights ---
+        old_colors = self._containers_colors
         self._containers_colors = {}
 
         # --- group color indices by target container index ---
@@ -617,8 +663,10 @@ class LinearContainerStructure(AlgoManimBase):
         if not self._data:
             return
 
-        # --- apply colors ---
-        self._apply_containers_colors()
+        # --- apply colors (only containers whose highlight changed) ---
+        self._apply_containers_colors(
+            self._changed_color_keys(old_colors, self._containers_colors)
+        )
 
     def highlight_pointers(
         self,
@@ -730,6 +778,48 @@ class LinearContainerStructure(AlgoManimBase):
 
         self._apply_pointers_colors(pos)
 
+    def highlight_containers_and_pointers(
+        self,
+        *indices: int,
+        pos: int = 0,
+        color_1: ManimColor | str | None = None,
+        color_2: ManimColor | str | None = None,
+        color_3: ManimColor | str | None = None,
+        color_4: ManimColor | str | None = None,
+        color_5: ManimColor | str | None = None,
+    ):
+        """Highlight containers and pointers at specified indices in one call.
+
+        Shortcut for the common `highlight_containers()` + `highlight_pointers()`
+        pair with the same indices and colors. Pointers are skipped if disabled.
+        All validation runs before anything is repainted.
+
+        Args:
+            *indices: Container indices to highlight (repetitions indicate blending).
+            pos: 0 for top pointers, 1 for bottom pointers.
+            color_1..color_5: Colors for each position in the input order.
+
+        Raises:
+            RuntimeError: If value_colors_map is active.
+            ValueError: If the number of indices exceeds the pointers mode limit
+                or pos is not 0 or 1.
+        """
+        # --- validation ---
+        if self._value_colors_map:
+            raise RuntimeError("Method is incompatible with value_colors_map mode.")
+
+        colors = {
+            "color_1": color_1,
+            "color_2": color_2,
+            "color_3": color_3,
+            "color_4": color_4,
+            "color_5": color_5,
+        }
+
+        # pointers validate the stricter index count before painting
+        self.highlight_pointers(*indices, pos=pos, **colors)
+        self.highlight_containers(*indices, **colors)
+
     def highlight_containers_monocolor(
         self,
         indices: Collection[int],
@@ -755,14 +845,17 @@ class LinearContainerStructure(AlgoManimBase):
             return
 
         # clear colors dict
+        old_colors = self._containers_colors
         self._containers_colors = {}
 
         # fill store
         for idx in indices:
             self._containers_colors[idx] = color
 
-        # apply
-        self._apply_containers_colors()
+        # apply (only containers whose highlight changed)
+        self._apply_containers_colors(
+            self._changed_color_keys(old_colors, self._containers_colors)
+        )
 
     def highlight_pointers_monocolor(
         self,
@@ -1,8 +1,47 @@
+import math
+from functools import lru_cache
+
 import manim as mn
 from manim import ManimColor
 from .base import AlgoManimBase
 
 
+@lru_cache(maxsize=None)
+def _fit_font_size(max_height: float, min_font_size: int = 10) -> int:
+    """Find the smallest font size whose "0" glyph reaches max_height.
+
+    Text height grows roughly linearly with font size, so a single
+    measurement gives a starting estimate. The estimate is then checked
+    against real glyphs and stepped by one until it is exact, instead of
+    rendering a test glyph for every size from min_font_size up.
+
+    Args:
+        max_height: Target glyph height.
+        min_font_size: Lower bound for the returned font size.
+
+    Returns:
+        Smallest integer font size with glyph height >= max_height.
+    """
+
+    def glyph_height(font_size: int) -> float:
+        return mn.Text("0", font_size=font_size).height
+
+    base_height = glyph_height(min_font_size)
+    if base_height >= max_height:
+        return min_font_size
+    font_size = max(
+        math.ceil(max_height * min_font_size / base_height), min_font_size + 1
+    )
+
+    # --- correct the estimate ---
+    while glyph_height(font_size) < max_height:
+        font_size += 1
+    while font_size - 1 > min_font_size and glyph_height(font_size - 1) >= max_height:
+        font_size -= 1
+
+    return font_size
+
+
 class NodeStructure(AlgoManimBase):
     """Base class for node-based data structures.
 
@@ -84,13 +123,7 @@ class NodeStructure(AlgoManimBase):
         top_bottom_buff = self._radius / 2
         max_size_test = (self._radius - top_bottom_buff) * 2
 
-        base_font_size = 10
-        test_mob = mn.Text("0", font_size=base_font_size)
-        while test_mob.height < max_size_test:
-            base_font_size += 1
-            test_mob = mn.Text("0", font_size=base_font_size)
-
-        return base_font_size
+        return _fit_font_size(max_size_test)
 
     def _assign_base_font_size(self) -> None:
         """Assign base font size if not already set.
@@ -90,7 +90,9 @@ class RectangleCellsStructure(LinearContainerStructure):
         """
 
         if not self._frame_from:
-            zero_mob = mn.Text(test_sign, font=font, font_size=font_size, weight=weight)
+            zero_mob = self._create_text(
+                test_sign, font=font, font_size=font_size, weight=weight
+            )
             zero_mob_height = zero_mob.height
             top_bottom_buff = zero_mob_height / self.CELL_CONFIG.top_bottom_buff_div
             cell_height = top_bottom_buff * 2 + zero_mob_height
@@ -100,7 +102,7 @@ class RectangleCellsStructure(LinearContainerStructure):
             )
             deep_bottom_buff = zero_mob_height / self.CELL_CONFIG.deep_bottom_buff_div
         else:
-            zero_mob = mn.Text(
+            zero_mob = self._create_text(
                 test_sign,
                 font=self._frame_from._font,
                 font_size=self._frame_from._font_size,
@@ -69,7 +69,7 @@ class RelativeTextBase(AlgoManimBase):
         Returns:
             Text mobject with configured font and size.
         """
-        return mn.Text(text, color=color, **self._get_text_config())
+        return self._create_text(text, color=color, **self._get_text_config())
 
     def _get_position(self):
         """Return text mobject for positioning purposes."""
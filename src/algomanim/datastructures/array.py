@@ -91,7 +91,7 @@ class Array(RectangleCellsStructure, UpdatableMixin):
         bg_color: ManimColor | str = mn.DARK_GRAY,
         fill_color: ManimColor | str = mn.DARK_GRAY,
         # ---- value colors mode ----
-        value_colors_map: dict[Any, list[ManimColor | str]] = {},
+        value_colors_map: dict[Any, list[ManimColor | str]] | None = None,
         # ---- cell params ----
         lock_width: bool = False,
         cell_params_auto: bool = True,
@@ -264,7 +264,7 @@ class Array(RectangleCellsStructure, UpdatableMixin):
             self._pointers_top = mn.VGroup()
             self._pointers_bottom = mn.VGroup()
 
-        self._empty_value_mob = mn.Text("[]", **self._text_config())
+        self._empty_value_mob = self._create_text("[]", **self._text_config())
 
         self._containers_mob = mn.VGroup(
             mn.Rectangle(
@@ -295,7 +295,7 @@ class Array(RectangleCellsStructure, UpdatableMixin):
             mn.VGroup: Group of value text mobjects.
         """
         values_mob = mn.VGroup(
-            *[mn.Text(str(val), **self._text_config()) for val in self._data]
+            *[self._create_text(str(val), **self._text_config()) for val in self._data]
         )
         return values_mob
 
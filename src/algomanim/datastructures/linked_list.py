@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, Callable, Literal, cast
 
 import numpy as np
@@ -11,6 +12,25 @@ from algomanim.core.updatable import UpdatableMixin
 from algomanim.assets.svg import SVG_DIR
 
 
+@lru_cache(maxsize=None)
+def _build_arrow(width: float) -> mn.SVGMobject:
+    """Parse the node arrow SVG once per width.
+
+    Cached instances are templates only and must never be added to a scene,
+    callers copy them.
+
+    Args:
+        width: Arrow width, equal to the node radius.
+
+    Returns:
+        Arrow mobject shared between all callers with the same width.
+    """
+    return mn.SVGMobject(
+        str(SVG_DIR / "arrows/radius_x10.svg"),
+        width=width,
+    )
+
+
 class LinkedList(LinearContainerStructure, NodeStructure, UpdatableMixin):
     """Linked list visualization as a VGroup of nodes with values and pointers.
 
@@ -69,7 +89,7 @@ class LinkedList(LinearContainerStructure, NodeStructure, UpdatableMixin):
         fill_color: ManimColor | str = mn.LIGHT_GRAY,
         bg_color: ManimColor | str = mn.DARK_GRAY,
         # ---- value colors mode ----
-        value_colors_map: dict[Any, list[ManimColor | str]] = {},
+        value_colors_map: dict[Any, list[ManimColor | str]] | None = None,
         # ---- kwargs ----
         **kwargs,
     ):
@@ -196,7 +216,7 @@ class LinkedList(LinearContainerStructure, NodeStructure, UpdatableMixin):
 
         top_bottom_buff = self._radius / 2
         max_size_center = (self._radius - top_bottom_buff) * 2.5
-        self._empty_value_mob = mn.Text(
+        self._empty_value_mob = self._create_text(
             "None",
             font_size=40,
             font=self._font,
@@ -227,11 +247,7 @@ class LinkedList(LinearContainerStructure, NodeStructure, UpdatableMixin):
             mn.VGroup: Group of arrow mobjects connecting the nodes.
         """
 
-        arrow_path = str(SVG_DIR / "arrows/radius_x10.svg")
-        arrow = mn.SVGMobject(
-            arrow_path,
-            width=self._radius,
-        )
+        arrow = _build_arrow(self._radius)
         arrows_mob = mn.VGroup()
         for i in range(len(self._data) - 1):
             new_arrow = arrow.copy()
@@ -303,7 +319,7 @@ class LinkedList(LinearContainerStructure, NodeStructure, UpdatableMixin):
 
         values_mob = mn.VGroup(
             *[
-                mn.Text(str(val), font_size=font_size, **self._text_config())
+                self._create_text(str(val), font_size=font_size, **self._text_config())
                 for val in self._data
             ]
         )
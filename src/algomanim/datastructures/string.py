@@ -81,7 +81,7 @@ class String(RectangleCellsStructure, UpdatableMixin):
         fill_color: ManimColor | str = mn.GRAY,
         bg_color: ManimColor | str = mn.DARK_GRAY,
         # ---- value colors mode ----
-        value_colors_map: dict[Any, list[ManimColor | str]] = {},
+        value_colors_map: dict[Any, list[ManimColor | str]] | None = None,
         # ---- cell params ----
         cell_params_auto=True,
         cell_height=0.65625,
@@ -261,7 +261,7 @@ class String(RectangleCellsStructure, UpdatableMixin):
             self._pointers_top = mn.VGroup()
             self._pointers_bottom = mn.VGroup()
 
-        self._empty_value_mob = mn.Text('""', **self._text_config())
+        self._empty_value_mob = self._create_text('""', **self._text_config())
         self._containers_mob = mn.VGroup(
             mn.Square(**self._containers_cell_config()),
         )
@@ -311,10 +311,10 @@ class String(RectangleCellsStructure, UpdatableMixin):
         """
 
         return mn.VGroup(
-            mn.Text('"', **self._text_config())
+            self._create_text('"', **self._text_config())
             .move_to(self._left_quote_cell_mob, aligned_edge=mn.UP + mn.RIGHT)
             .shift(mn.DOWN * self._top_buff),
-            mn.Text('"', **self._text_config())
+            self._create_text('"', **self._text_config())
             .move_to(self._right_quote_cell_mob, aligned_edge=mn.UP + mn.LEFT)
             .shift(mn.DOWN * self._top_buff),
         )
@@ -327,7 +327,10 @@ class String(RectangleCellsStructure, UpdatableMixin):
         """
 
         return mn.VGroup(
-            *[mn.Text(str(letter), **self._text_config()) for letter in self._data]
+            *[
+                self._create_text(str(letter), **self._text_config())
+                for letter in self._data
+            ]
         )
 
     def _position_values_in_containers(
@@ -404,24 +407,25 @@ class String(RectangleCellsStructure, UpdatableMixin):
             **self._parent_kwargs,
         )
 
-        # copy anchor alignment
+        # copy anchor alignment (new instance already holds the fresh value)
+        new_data = new_instance._data
         if self._anchor is not None:
             if self._anchor == "start":
-                if self._data and self._callable():
+                if self._data and new_data:
                     new_instance.align_to(self.get_left(), mn.LEFT)
-                elif self._data and not self._callable():
+                elif self._data and not new_data:
                     new_instance.align_to(self._containers_mob.get_left(), mn.LEFT)
-                elif not self._data and self._callable():
+                elif not self._data and new_data:
                     target = self._containers_mob.get_left() + mn.LEFT * (
                         self._cell_height / 2
                     )
                     new_instance.align_to(target, mn.LEFT)
             elif self._anchor == "end":
-                if self._data and self._callable():
+                if self._data and new_data:
                     new_instance.align_to(self.get_right(), mn.RIGHT)
-                elif self._data and not self._callable():
+                elif self._data and not new_data:
                     new_instance.align_to(self._containers_mob.get_right(), mn.RIGHT)
-                elif not self._data and self._callable():
+                elif not self._data and new_data:
                     target = self._containers_mob.get_right() + mn.RIGHT * (
                         self._cell_height / 2
                     )
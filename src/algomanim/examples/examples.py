@@ -30,6 +30,7 @@ from algomanim import (
 )
 
 group_appear = AlgoManimBase.group_appear
+group_update = AlgoManimBase.group_update
 print_scene = AlgoManimBase._print_scene
 
 
@@ -1020,49 +1021,37 @@ class Example_array(mn.Scene):
             arr = [1, 2]
             arr_text.update_value(self)
             self.wait(pause)
-            array1.update_value(self)
-            array2.update_value(self)
-            array3.update_value(self)
+            group_update(self, array1, array2, array3)
             self.wait(pause)
 
             arr = [1]
             arr_text.update_value(self)
             self.wait(pause)
-            array1.update_value(self)
-            array2.update_value(self)
-            array3.update_value(self)
+            group_update(self, array1, array2, array3)
             self.wait(pause)
 
             arr = []
             arr_text.update_value(self)
             self.wait(pause)
-            array1.update_value(self)
-            array2.update_value(self)
-            array3.update_value(self)
+            group_update(self, array1, array2, array3)
             self.wait(pause)
 
             arr = [1]
             arr_text.update_value(self)
             self.wait(pause)
-            array1.update_value(self)
-            array2.update_value(self)
-            array3.update_value(self)
+            group_update(self, array1, array2, array3)
             self.wait(1)
 
             arr = [1, 2]
             arr_text.update_value(self)
             self.wait(pause)
-            array1.update_value(self)
-            array2.update_value(self)
-            array3.update_value(self)
+            group_update(self, array1, array2, array3)
             self.wait(1)
 
             arr = [1, 2, 3]
             arr_text.update_value(self)
             self.wait(pause)
-            array1.update_value(self)
-            array2.update_value(self)
-            array3.update_value(self)
+            group_update(self, array1, array2, array3)
             self.wait(1)
 
             self.clear()
@@ -1153,28 +1142,19 @@ class Example_array(mn.Scene):
             arr = [1, 22, 333]
             arr_text.update_value(self)
             self.wait(pause)
-            array1.update_value(self)
-            array2.update_value(self)
-            array3.update_value(self)
-            array4.update_value(self)
+            group_update(self, array1, array2, array3, array4)
             self.wait(pause)
 
             arr = [1111, 22, 333]
             arr_text.update_value(self)
             self.wait(pause)
-            array1.update_value(self)
-            array2.update_value(self)
-            array3.update_value(self)
-            array4.update_value(self)
+            group_update(self, array1, array2, array3, array4)
             self.wait(pause)
 
             arr = [1, 2, 3]
             arr_text.update_value(self)
             self.wait(pause)
-            array1.update_value(self)
-            array2.update_value(self)
-            array3.update_value(self)
-            array4.update_value(self)
+            group_update(self, array1, array2, array3, array4)
             self.wait(1)
 
             self.clear()
@@ -1416,7 +1396,7 @@ class Example_array(mn.Scene):
             pause = 1
 
             title = RelativeText(
-                "pointers_mode param; highlight_containers(); higlight_pointers()",
+                "pointers_mode param; highlight_containers_and_pointers()",
                 font_size=30,
                 text_color=mn.BLACK,
                 align_screen=mn.UP,
@@ -1460,8 +1440,7 @@ class Example_array(mn.Scene):
                 nonlocal indices
                 indices = new_indices
                 text.update_value(scene, animate=False)
-                array.highlight_containers(*new_indices)
-                array.highlight_pointers(*new_indices)
+                array.highlight_containers_and_pointers(*new_indices)
                 self.wait(pause)
 
             cycle(self, array, param_text, (0, 1, 2))
@@ -1838,11 +1817,7 @@ class Example_array(mn.Scene):
             def cycle(self, new_arr: list):
                 nonlocal arr
                 arr = new_arr
-                arr_1.update_value(self)
-                arr_2.update_value(self)
-                arr_3.update_value(self)
-                arr_4.update_value(self)
-                arr_5.update_value(self)
+                group_update(self, arr_1, arr_2, arr_3, arr_4, arr_5)
                 self.wait(pause)
 
             cycle(self, [1, 2])
@@ -2518,7 +2493,7 @@ class Example_string(mn.Scene):
             string_40.first_appear(self, anim_time=0.1)
 
             self.wait(1)
-            self.clear()
+            self.remove(string, string_20, string_25, string_35, string_40)
             print_scene(self)
 
         def first_appear(self):
@@ -2706,32 +2681,29 @@ class Example_string(mn.Scene):
             group_appear(self, string, top_text)
             self.wait(pause)
 
-            self.remove(string, top_text)
+            self.remove(string)
 
-            top_text = RelativeText(
-                "mob_center=mob_center\nalign_left=mob_center\nvector=mn.UP * 1",
-                vector=mn.DOWN * 2 + mn.RIGHT * 0,
+            top_text.set_text(
+                "mob_center=mob_center\nalign_left=mob_center\nvector=mn.UP * 1"
             )
             string = String(
                 lambda: s, mob_center=center, align_left=center, vector=mn.UP * 2
             )
-            group_appear(self, string, top_text)
+            string.first_appear(self)
             self.wait(pause)
 
-            self.remove(string, top_text)
+            self.remove(string)
 
-            top_text = RelativeText(
-                "mob_center=mob_center\nalign_right=mob_center\nvector=mn.UP * 1",
-                vector=mn.DOWN * 2 + mn.RIGHT * 0,
+            top_text.set_text(
+                "mob_center=mob_center\nalign_right=mob_center\nvector=mn.UP * 1"
             )
             string = String(
                 lambda: s, mob_center=center, align_right=center, vector=mn.UP * 2
             )
-            group_appear(self, string, top_text)
+            string.first_appear(self)
             self.wait(pause)
 
-            self.clear()
-            title.first_appear(self)
+            self.remove(string, top_text, center)
 
             one = String(lambda: "one", font_size=60, vector=mn.UP * 2.7 + mn.LEFT * 4)
             two = String(
@@ -2749,14 +2721,11 @@ class Example_string(mn.Scene):
             string = String(lambda: s, align_left=one, align_bottom=two)
             group_appear(self, string, top_text)
             self.wait(pause)
-            self.remove(string, top_text)
+            self.remove(string)
 
-            top_text = RelativeText(
-                "align_left=one\nalign_top=two",
-                vector=mn.UP * 1 + mn.RIGHT * 2,
-            )
+            top_text.set_text("align_left=one\nalign_top=two")
             string = String(lambda: s, align_left=one, align_top=two)
-            group_appear(self, string, top_text)
+            string.first_appear(self)
             self.wait(pause)
             update_text = RelativeText(
                 "update_value()",
@@ -2779,14 +2748,11 @@ class Example_string(mn.Scene):
             string.update_value(self)
             self.wait(0.5)
 
-            self.remove(string, top_text, update_text)
+            self.remove(string, update_text)
 
-            top_text = RelativeText(
-                "align_right=one\nalign_top=two",
-                vector=mn.UP * 1 + mn.RIGHT * 2,
-            )
+            top_text.set_text("align_right=one\nalign_top=two")
             string = String(lambda: s, align_right=one, align_top=two)
-            group_appear(self, string, top_text)
+            string.first_appear(self)
             self.wait(pause)
             update_text = RelativeText(
                 "update_value()",
@@ -2809,14 +2775,11 @@ class Example_string(mn.Scene):
             string.update_value(self)
             self.wait(0.5)
 
-            self.remove(string, top_text, update_text)
+            self.remove(string, update_text)
 
-            top_text = RelativeText(
-                "align_right=one\nalign_bottom=two",
-                vector=mn.UP * 1 + mn.RIGHT * 2,
-            )
+            top_text.set_text("align_right=one\nalign_bottom=two")
             string = String(lambda: s, align_right=one, align_bottom=two)
-            group_appear(self, string, top_text)
+            string.first_appear(self)
             self.wait(pause)
             self.remove(string, top_text)
 
@@ -2832,7 +2795,7 @@ class Example_string(mn.Scene):
             )
             group_appear(self, string, top_text)
             self.wait(pause)
-            self.clear()
+            self.remove(string, top_text, title, one, two)
             print_scene(self)
 
         def position_after_update(self):
@@ -2937,11 +2900,7 @@ class Example_string(mn.Scene):
             def cycle(self, new_str: str):
                 nonlocal s
                 s = new_str
-                str_1.update_value(self)
-                str_2.update_value(self)
-                str_3.update_value(self)
-                str_4.update_value(self)
-                str_5.update_value(self)
+                group_update(self, str_1, str_2, str_3, str_4, str_5)
                 self.wait(pause)
 
             cycle(self, "12")
@@ -3014,7 +2973,21 @@ class Example_string(mn.Scene):
             cycle(self, "123")
 
             self.wait(1)
-            self.clear()
+            self.remove(
+                center,
+                text_title,
+                str_1,
+                str_2,
+                str_3,
+                str_4,
+                str_5,
+                text_no_align,
+                text_str_1,
+                text_str_2,
+                text_str_3,
+                text_str_4,
+                text_str_5,
+            )
             print_scene(self)
 
         def frame_import(self):
@@ -3144,7 +3117,7 @@ class Example_string(mn.Scene):
             pause = 1
 
             title = RelativeText(
-                "pointers()   highlight_containers()   higlight_pointers()",
+                "pointers_mode param; highlight_containers_and_pointers()",
                 font_size=35,
                 text_color=mn.BLACK,
                 align_screen=mn.UP,
@@ -3188,8 +3161,7 @@ class Example_string(mn.Scene):
                 nonlocal indices
                 indices = new_indices
                 text.update_value(scene, animate=False)
-                string.highlight_containers(*new_indices)
-                string.highlight_pointers(*new_indices)
+                string.highlight_containers_and_pointers(*new_indices)
                 self.wait(pause)
 
             cycle(self, string, param_text, (0, 1, 2))
@@ -3242,7 +3214,7 @@ class Example_string(mn.Scene):
             string.clear_pointers_highlights(0)
             string.clear_containers_highlights()
 
-            self.clear()
+            self.remove(command_text, string, param_text)
             print_scene(self)
 
         def highlights_monocolor(self):
@@ -3263,7 +3235,7 @@ class Example_string(mn.Scene):
             s = "follow rabbit"
             string.update_value(self)
             self.wait(2)
-            self.clear()
+            self.remove(string, top_text)
             print_scene(self)
 
         def highlight_on_value(self):
@@ -3298,7 +3270,7 @@ class Example_string(mn.Scene):
             string.highlight_containers_with_value(" ", color=mn.PINK)
             string.highlight_pointers_above_value(" ", color=mn.PINK, pos=0)
             self.wait(1)
-            self.clear()
+            self.remove(string, top_text)
             print_scene(self)
 
         def pointers_on_values(self):
@@ -3566,11 +3538,14 @@ class Example_linked_list(mn.Scene):
             )
 
             self.wait(pause)
-            self.clear()
+            self.remove(title)
             print_scene(self)
 
         def positioning(self):
 
+            # node data is the same for every list, build it once
+            head = cll([0, 1])
+
             center = Array(lambda: list("mob_center"), font_size=40)
             center.first_appear(self)
 
@@ -3579,44 +3554,42 @@ class Example_linked_list(mn.Scene):
                 vector=mn.DOWN * 2 + mn.RIGHT * 0,
             )
             ll = LinkedList(
-                lambda: cll([0, 1]),
+                lambda: head,
                 mob_center=center,
                 vector=mn.UP * 2,
             )
             group_appear(self, ll, top_text)
             self.wait(pause)
 
-            self.remove(ll, top_text)
+            self.remove(ll)
 
-            top_text = RelativeText(
-                "mob_center=mob_center\nalign_left=mob_center\nvector=mn.UP * 2",
-                vector=mn.DOWN * 2 + mn.RIGHT * 0,
+            top_text.set_text(
+                "mob_center=mob_center\nalign_left=mob_center\nvector=mn.UP * 2"
             )
             ll = LinkedList(
-                lambda: cll([0, 1]),
+                lambda: head,
                 mob_center=center,
                 align_left=center,
                 vector=mn.UP * 2,
             )
-            group_appear(self, ll, top_text)
+            ll.first_appear(self)
             self.wait(pause)
 
-            self.remove(ll, top_text)
+            self.remove(ll)
 
-            top_text = RelativeText(
-                "mob_center=mob_center\nalign_right=mob_center\nvector=mn.UP * 2",
-                vector=mn.DOWN * 2 + mn.RIGHT * 0,
+            top_text.set_text(
+                "mob_center=mob_center\nalign_right=mob_center\nvector=mn.UP * 2"
             )
             ll = LinkedList(
-                lambda: cll([0, 1]),
+                lambda: head,
                 mob_center=center,
                 align_right=center,
                 vector=mn.UP * 2,
             )
-            group_appear(self, ll, top_text)
+            ll.first_appear(self)
             self.wait(pause)
 
-            self.clear()
+            self.remove(ll, top_text, center)
             print_scene(self)
 
             one = Array(
@@ -3635,50 +3608,41 @@ class Example_linked_list(mn.Scene):
                 vector=mn.UP * 1 + mn.RIGHT * 2,
             )
             ll = LinkedList(
-                lambda: cll([0, 1]),
+                lambda: head,
                 align_left=one,
                 align_bottom=two,
             )
             group_appear(self, ll, top_text)
             self.wait(pause)
-            self.remove(ll, top_text)
+            self.remove(ll)
 
-            top_text = RelativeText(
-                "align_left=one\nalign_top=two",
-                vector=mn.UP * 1 + mn.RIGHT * 2,
-            )
+            top_text.set_text("align_left=one\nalign_top=two")
             ll = LinkedList(
-                lambda: cll([0, 1]),
+                lambda: head,
                 align_left=one,
                 align_top=two,
             )
-            group_appear(self, ll, top_text)
+            ll.first_appear(self)
             self.wait(pause)
-            self.remove(ll, top_text)
+            self.remove(ll)
 
-            top_text = RelativeText(
-                "align_right=one\nalign_top=two",
-                vector=mn.UP * 1 + mn.RIGHT * 2,
-            )
+            top_text.set_text("align_right=one\nalign_top=two")
             ll = LinkedList(
-                lambda: cll([0, 1]),
+                lambda: head,
                 align_right=one,
                 align_top=two,
             )
-            group_appear(self, ll, top_text)
+            ll.first_appear(self)
             self.wait(pause)
-            self.remove(ll, top_text)
+            self.remove(ll)
 
-            top_text = RelativeText(
-                "align_right=one\nalign_bottom=two",
-                vector=mn.UP * 1 + mn.RIGHT * 2,
-            )
+            top_text.set_text("align_right=one\nalign_bottom=two")
             ll = LinkedList(
-                lambda: cll([0, 1]),
+                lambda: head,
                 align_right=one,
                 align_bottom=two,
             )
-            group_appear(self, ll, top_text)
+            ll.first_appear(self)
             self.wait(pause)
             self.remove(ll, top_text)
 
@@ -3687,14 +3651,14 @@ class Example_linked_list(mn.Scene):
                 vector=mn.UP * 0.7 + mn.RIGHT * 2,
             )
             ll = LinkedList(
-                lambda: cll([0, 1]),
+                lambda: head,
                 align_left=one,
                 align_bottom=two,
                 vector=mn.UP * 1 + mn.RIGHT * 1,
             )
             group_appear(self, ll, top_text)
             self.wait(pause)
-            self.clear()
+            self.remove(ll, top_text, one, two)
             print_scene(self)
 
         def pointers(self):
@@ -3913,14 +3877,14 @@ class Example_linked_list(mn.Scene):
             ll3.highlight_pointers(1, pos=1, color_1=mn.PINK)
 
             self.wait(1)
-            self.clear()
+            self.remove(title, p_text, text1, text2, text3, ll1, ll2, ll3)
             print_scene(self)
 
         def highlights(self):
             pause = 1
 
             title = RelativeText(
-                "pointers_mode param; highlight_containers(); highlight_pointers()",
+                "pointers_mode param; highlight_containers_and_pointers()",
                 font_size=30,
                 text_color=mn.BLACK,
                 align_screen=mn.UP,
@@ -3962,8 +3926,7 @@ class Example_linked_list(mn.Scene):
                 nonlocal indices
                 indices = new_indices
                 text.update_value(scene, animate=False)
-                ll.highlight_containers(*new_indices)
-                ll.highlight_pointers(*new_indices)
+                ll.highlight_containers_and_pointers(*new_indices)
                 self.wait(pause)
 
             cycle(self, param_text, (0, 1, 2))
@@ -4015,97 +3978,47 @@ class Example_linked_list(mn.Scene):
             ll.clear_pointers_highlights(0)
             ll.clear_containers_highlights()
 
-            self.clear()
+            self.remove(command_text, ll, param_text)
             print_scene(self)
 
         def rotation(self):
             pause = 0.3
 
-            ll = LinkedList(
-                lambda: cll([0, 1, 2]),
-            )
-            ll.appear(self)
-            ll.highlight_pointers(0, 1, 2)
-            self.wait(pause)
-
-            self.remove(ll)
-            ll = LinkedList(
-                lambda: cll([0, 1, 2]),
-                direction=np.array([10, -10, 0]),
-            )
-            ll.appear(self)
-            ll.highlight_pointers(0, 1, 2)
-            self.wait(pause)
-
-            self.remove(ll)
-            ll = LinkedList(
-                lambda: cll([0, 1, 2]),
-                direction=np.array([0, -10, 0]),
-            )
-            ll.appear(self)
-            ll.highlight_pointers(0, 1, 2)
-            self.wait(pause)
-
-            self.remove(ll)
-            ll = LinkedList(
-                lambda: cll([0, 1, 2]),
-                direction=np.array([-10, -10, 0]),
-            )
-            ll.appear(self)
-            ll.highlight_pointers(0, 1, 2)
-            self.wait(pause)
-
-            self.remove(ll)
-            ll = LinkedList(
-                lambda: cll([0, 1, 2]),
-                direction=np.array([-10, 0, 0]),
-            )
-            ll.appear(self)
-            ll.highlight_pointers(0, 1, 2)
-            self.wait(pause)
-
-            self.remove(ll)
-            ll = LinkedList(
-                lambda: cll([0, 1, 2]),
-                direction=np.array([-10, 10, 0]),
-            )
-            ll.appear(self)
-            ll.highlight_pointers(0, 1, 2)
-            self.wait(pause)
-
-            self.remove(ll)
-            ll = LinkedList(
-                lambda: cll([0, 1, 2]),
-                direction=np.array([0, 10, 0]),
-            )
-            ll.appear(self)
-            ll.highlight_pointers(0, 1, 2)
-            self.wait(pause)
-
-            self.remove(ll)
-            ll = LinkedList(
-                lambda: cll([0, 1, 2]),
-                direction=np.array([10, 10, 0]),
-            )
-            ll.appear(self)
-            ll.highlight_pointers(0, 1, 2)
-            self.wait(pause)
-
-            self.remove(ll)
-            ll = LinkedList(
-                lambda: cll([0, 1, 2]),
-            )
-            ll.appear(self)
-            ll.highlight_pointers(0, 1, 2)
-            self.wait(1)
-            self.remove(ll)
+            # manim's shared direction constants, clockwise from mn.RIGHT
+            directions = (
+                mn.RIGHT,
+                mn.DR,
+                mn.DOWN,
+                mn.DL,
+                mn.LEFT,
+                mn.UL,
+                mn.UP,
+                mn.UR,
+                mn.RIGHT,
+            )
+
+            # node data is the same for every direction, build it once
+            head = cll([0, 1, 2])
+
+            for direction in directions:
+                ll = LinkedList(
+                    lambda: head,
+                    direction=direction,
+                )
+                ll.appear(self)
+                ll.highlight_pointers(0, 1, 2)
+                self.wait(pause)
+                self.remove(ll)
 
             self.wait(1)
-            self.clear()
             print_scene(self)
 
         def alignment(self):
 
+            # node data is shared by both lists of each demo, build it once
+            head_3 = cll([0, 1, 2])
+            head_2 = cll([0, 1])
+
             # ======== left | right alignment ============
 
             mob_center = Array(
@@ -4116,14 +4029,14 @@ class Example_linked_list(mn.Scene):
             mob_center.first_appear(self)
 
             ll1 = LinkedList(
-                lambda: cll([0, 1, 2]),
+                lambda: head_3,
                 radius=0.3,
                 mob_center=mob_center,
                 align_right=mob_center,
                 vector=mn.DOWN * 2,
             )
             ll2 = LinkedList(
-                lambda: cll([0, 1, 2]),
+                lambda: head_3,
                 radius=0.3,
                 mob_center=mob_center,
                 align_left=mob_center,
@@ -4164,7 +4077,7 @@ class Example_linked_list(mn.Scene):
             self.play(mob_center.animate.move_to(mn.ORIGIN))
 
             ll1 = LinkedList(
-                lambda: cll([0, 1]),
+                lambda: head_2,
                 radius=0.8,
                 mob_center=mob_center,
                 align_top=mob_center,
@@ -4172,7 +4085,7 @@ class Example_linked_list(mn.Scene):
                 direction=mn.UP,
             )
             ll2 = LinkedList(
-                lambda: cll([0, 1]),
+                lambda: head_2,
                 radius=0.8,
                 mob_center=mob_center,
                 align_bottom=mob_center,
@@ -4201,7 +4114,7 @@ class Example_linked_list(mn.Scene):
             )
 
             self.wait(1)
-            self.clear()
+            self.remove(mob_center, ll1, ll2, rt1, rt2)
             print_scene(self)
 
         def position_after_update(self):
@@ -4332,11 +4245,7 @@ class Example_linked_list(mn.Scene):
             def cycle(self, new_list: list):
                 nonlocal ln
                 ln = cll(new_list)
-                ll_1.update_value(self)
-                ll_2.update_value(self)
-                ll_3.update_value(self)
-                ll_4.update_value(self)
-                ll_5.update_value(self)
+                group_update(self, ll_1, ll_2, ll_3, ll_4, ll_5)
                 self.wait(pause)
 
             cycle(self, [1, 2])
@@ -4414,12 +4323,51 @@ class Example_linked_list(mn.Scene):
             cycle(self, [1, 2, 3])
 
             self.wait(1)
-            self.clear()
+            self.remove(
+                center,
+                title,
+                ll_1,
+                ll_2,
+                ll_3,
+                ll_4,
+                ll_5,
+                text_no_align,
+                text_arr_1,
+                text_arr_2,
+                text_arr_3,
+                text_arr_4,
+                text_arr_5,
+            )
             print_scene(self)
 
         def update_value_direction(self):
 
-            ln = cll([0, 12, 12345, "'", '^"', ".", "_.,", "Aa", "acv", "gjy", "gyp"])
+            # the same heads are reused by every block below
+            long_list = cll(
+                [0, 12, 12345, "'", '^"', ".", "_.,", "Aa", "acv", "gjy", "gyp"]
+            )
+            mid_list = cll([0, 12, 12345, "'", '^"', ".", "_.,", "Aa"])
+            short_list = cll([0, 12, 12345, "'", '^"'])
+            steps = (
+                mid_list,
+                short_list,
+                None,
+                cll([0, 12]),
+                short_list,
+                mid_list,
+                long_list,
+            )
+
+            direction = np.array([10, 2, 0])
+
+            def cycle():
+                nonlocal ln
+                for head in steps:
+                    ln = head
+                    ll.update_value(self)
+                    self.wait(pause)
+
+            ln = long_list
 
             title = RelativeText(
                 "anchor='start'\ndirection=np.array([10, 2, 0])\nupdate_value()",
@@ -4431,7 +4379,7 @@ class Example_linked_list(mn.Scene):
 
             ll = LinkedList(
                 lambda: ln,
-                direction=np.array([10, 2, 0]),
+                direction=direction,
                 vector=mn.DOWN * 1,
                 anchor="start",
             )
@@ -4440,182 +4388,39 @@ class Example_linked_list(mn.Scene):
             ll.first_appear(self)
             self.wait(pause)
 
-            ln = cll([0, 12, 12345, "'", '^"', ".", "_.,", "Aa"])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([0, 12, 12345, "'", '^"'])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([0, 12])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([0, 12, 12345, "'", '^"'])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([0, 12, 12345, "'", '^"', ".", "_.,", "Aa"])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([0, 12, 12345, "'", '^"', ".", "_.,", "Aa", "acv", "gjy", "gyp"])
-            ll.update_value(self)
-            self.wait(pause)
-            self.clear()
-            print_scene(self)
-
-            # ------------------
-
-            ln = cll([0, 12, 12345, "'", '^"', ".", "_.,", "Aa", "acv", "gjy", "gyp"])
-            ll = LinkedList(
-                lambda: ln,
-                direction=np.array([10, 2, 0]),
-                vector=mn.DOWN * 1,
-                anchor="end",
-            )
-            ll.highlight_containers(0, 2, 4)
-            ll.highlight_pointers(0, 2, 4)
-            title = RelativeText(
-                "anchor='end'\ndirection=np.array([10, 2, 0])\nupdate_value()",
-                align_left=ll,
-                vector=mn.UP * 3,
-            )
-            group_appear(self, ll, title)
-            self.wait(pause)
-
-            ln = cll([0, 12, 12345, "'", '^"', ".", "_.,", "Aa"])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([0, 12, 12345, "'", '^"'])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([0, 12])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([0, 12, 12345, "'", '^"'])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([0, 12, 12345, "'", '^"', ".", "_.,", "Aa"])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([0, 12, 12345, "'", '^"', ".", "_.,", "Aa", "acv", "gjy", "gyp"])
-            ll.update_value(self)
-            self.wait(pause)
-            self.clear()
-            print_scene(self)
-
-            # ------------------
-
-            ln = cll([0, 12, 12345, "'", '^"', ".", "_.,", "Aa", "acv", "gjy", "gyp"])
-            ll = LinkedList(
-                lambda: ln,
-                direction=np.array([-10, -2, 0]),
-                vector=mn.DOWN * 1,
-                anchor="end",
-            )
-            ll.highlight_containers(0, 2, 4)
-            ll.highlight_pointers(0, 2, 4)
-            title = RelativeText(
-                "anchor='end'\ndirection=np.array([-10, -2, 0])\nupdate_value()",
-                align_left=ll,
-                vector=mn.UP * 3,
-            )
-            group_appear(self, ll, title)
-            self.wait(pause)
-
-            ln = cll([0, 12, 12345, "'", '^"', ".", "_.,", "Aa"])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([0, 12, 12345, "'", '^"'])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([0, 12])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([0, 12, 12345, "'", '^"'])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([0, 12, 12345, "'", '^"', ".", "_.,", "Aa"])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([0, 12, 12345, "'", '^"', ".", "_.,", "Aa", "acv", "gjy", "gyp"])
-            ll.update_value(self)
-            self.wait(pause)
-            self.clear()
+            cycle()
+            self.remove(ll, title)
             print_scene(self)
 
             # ------------------
 
-            ln = cll([0, 12, 12345, "'", '^"', ".", "_.,", "Aa", "acv", "gjy", "gyp"])
-            ll = LinkedList(
-                lambda: ln,
-                direction=np.array([10, 2, 0]),
-                vector=mn.DOWN * 1,
-                anchor=None,
-            )
-            ll.highlight_containers(0, 2, 4)
-            ll.highlight_pointers(0, 2, 4)
-            title = RelativeText(
-                "anchor=None\ndirection=np.array([10, 2, 0])\nupdate_value()",
-                align_left=ll,
-                vector=mn.UP * 3,
-            )
-            group_appear(self, ll, title)
-            self.wait(pause)
-
-            ln = cll([0, 12, 12345, "'", '^"', ".", "_.,", "Aa"])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([0, 12, 12345, "'", '^"'])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([0, 12])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([0, 12, 12345, "'", '^"'])
-            ll.update_value(self)
-            self.wait(pause)
-
-            ln = cll([0, 12, 12345, "'", '^"', ".", "_.,", "Aa"])
-            ll.update_value(self)
-            self.wait(pause)
+            for anchor, vec in (
+                ("end", direction),
+                ("end", -direction),
+                (None, direction),
+            ):
+                ln = long_list
+                ll = LinkedList(
+                    lambda: ln,
+                    direction=vec,
+                    vector=mn.DOWN * 1,
+                    anchor=anchor,
+                )
+                ll.highlight_containers(0, 2, 4)
+                ll.highlight_pointers(0, 2, 4)
+                title = RelativeText(
+                    f"anchor={anchor!r}\n"
+                    f"direction=np.array({vec.tolist()})\n"
+                    "update_value()",
+                    align_left=ll,
+                    vector=mn.UP * 3,
+                )
+                group_appear(self, ll, title)
+                self.wait(pause)
 
-            ln = cll([0, 12, 12345, "'", '^"', ".", "_.,", "Aa", "acv", "gjy", "gyp"])
-            ll.update_value(self)
-            self.wait(pause)
-            self.clear()
-            print_scene(self)
+                cycle()
+                self.remove(ll, title)
+                print_scene(self)
 
         def highlights_1to3(self):
             pause = 0.5
@@ -4657,7 +4462,7 @@ class Example_linked_list(mn.Scene):
             lln.clear_containers_highlights()
             lln.clear_pointers_highlights(0)
             self.wait(1)
-            self.clear()
+            self.remove(lln, rt)
             print_scene(self)
 
         def highlights_monocolor(self):
@@ -4684,7 +4489,7 @@ class Example_linked_list(mn.Scene):
             self.wait(pause)
             lln.highlight_containers_monocolor([1, 3, 5, 7])
             self.wait(pause)
-            self.clear()
+            self.remove(lln, rt)
             print_scene(self)
 
         def highlight_on_value(self):
@@ -4723,7 +4528,7 @@ class Example_linked_list(mn.Scene):
             cycle(self, 0, [22, 0, 22, 0, 22], mn.PINK)
 
             self.wait(pause)
-            self.clear()
+            self.remove(ll, title)
             print_scene(self)
 
         def value_colors_map_mode(self):
@@ -4940,35 +4745,28 @@ class Example_code_block(mn.Scene):
             def highlight_with_title(
                 self: mn.Scene,
                 code_block: CodeBlock,
-                old_title: mn.Mobject,
+                title: RelativeText,
                 *indices: int,
                 pause=2,
             ):
                 code_block.highlight(*indices)
 
-                left_point = old_title.get_left()
-                self.remove(old_title)
-
+                left_point = title.get_left()
                 args_str = f"({', '.join(map(str, indices))})"
 
-                new_title = RelativeText(
-                    f"highlight{args_str}",
-                    font_size=30,
-                )
-                vector = left_point - new_title.get_left()
-                new_title.shift(vector)
-                new_title.appear(self)
+                # keep the same title on the scene, left edge stays in place
+                title.set_text(f"highlight{args_str}")
+                title.shift(left_point - title.get_left())
                 self.wait(pause)
-                return new_title
-
-            title = highlight_with_title(self, cb, title, 0)
-            title = highlight_with_title(self, cb, title, 1)
-            title = highlight_with_title(self, cb, title, 2)
-            title = highlight_with_title(self, cb, title, 3, 5, 7, pause=2)
-            title = highlight_with_title(self, cb, title, 9, 10, 11, pause=2)
-            title = highlight_with_title(self, cb, title, 13)
-            title = highlight_with_title(self, cb, title, 0, 2, 4, 6, 8, 10, 12)
-            title = highlight_with_title(self, cb, title, 1, 3, 5, 7, 9, 11, 13)
+
+            highlight_with_title(self, cb, title, 0)
+            highlight_with_title(self, cb, title, 1)
+            highlight_with_title(self, cb, title, 2)
+            highlight_with_title(self, cb, title, 3, 5, 7, pause=2)
+            highlight_with_title(self, cb, title, 9, 10, 11, pause=2)
+            highlight_with_title(self, cb, title, 13)
+            highlight_with_title(self, cb, title, 0, 2, 4, 6, 8, 10, 12)
+            highlight_with_title(self, cb, title, 1, 3, 5, 7, 9, 11, 13)
 
             self.remove(cb)
             self.wait(0.5)
@@ -1,12 +1,14 @@
 #!/bin/bash
 
-# Usage: ./rend_no_poetry.sh -l|-m|-h class_name (without 'Example_', case-insensitive)
+# Usage: ./rend_no_poetry.sh -l|-m|-h class_name [class_name ...] (without 'Example_', case-insensitive)
 # Example: ./rend_no_poetry.sh -l code_block
+# Example: ./rend_no_poetry.sh -l array string linked_list   (rendered in parallel)
+# Example: ALGOMANIM_DEV=1 ./rend_no_poetry.sh -l array   (keep manim's cache between runs)
 
 set -e
 
-if [ $# -ne 2 ]; then
-    echo "Usage: $0 -l|-m|-h ClassName"
+if [ $# -lt 2 ]; then
+    echo "Usage: $0 -l|-m|-h ClassName [ClassName ...]"
     exit 1
 fi
 
@@ -32,24 +34,54 @@ case "$1" in
         ;;
 esac
 
-NAME_LOWER=$(echo "$2" | tr '[:upper:]' '[:lower:]')
+NAMES=()
+for NAME in "${@:2}"; do
+    NAME_LOWER=$(echo "$NAME" | tr '[:upper:]' '[:lower:]')
 
-# Format class name: Example_ + name_snake_case
-CLASS="Example_${NAME_LOWER}"
+    # Format class name: Example_ + name_snake_case
+    CLASS="Example_${NAME_LOWER}"
 
-if ! grep -q "class $CLASS(" examples.py; then
-    echo "Error: Class '$CLASS' not found in examples.py"
-    exit 1
-fi
+    if ! grep -q "class $CLASS(" examples.py; then
+        echo "Error: Class '$CLASS' not found in examples.py"
+        exit 1
+    fi
+    NAMES+=("$NAME_LOWER")
+done
 
-python -m manim -"${QUALITY}" examples.py "$CLASS"
+# Example scenes are independent: render each one in its own manim process
+# with a private media dir, so they can run on separate cores.
+PIDS=()
+for NAME_LOWER in "${NAMES[@]}"; do
+    python -m manim -"${QUALITY}" --media_dir "media/${NAME_LOWER}" \
+        examples.py "Example_${NAME_LOWER}" &
+    PIDS+=($!)
+done
 
-OUTFILE="media/videos/examples/${RESDIR}/${CLASS}.mp4"
-if [ ! -f "$OUTFILE" ]; then
-    echo "Error: Output file '$OUTFILE' not found"
+FAILED=0
+for PID in "${PIDS[@]}"; do
+    wait "$PID" || FAILED=1
+done
+if [ "$FAILED" -ne 0 ]; then
+    echo "Error: Render failed"
     exit 1
 fi
 
-mv "$OUTFILE" "video_output/${OUTDIR}/${NAME_LOWER}.mp4"
-rm -rf media __pycache__
+for NAME_LOWER in "${NAMES[@]}"; do
+    OUTFILE="media/${NAME_LOWER}/videos/examples/${RESDIR}/Example_${NAME_LOWER}.mp4"
+    if [ ! -f "$OUTFILE" ]; then
+        echo "Error: Output file '$OUTFILE' not found"
+        exit 1
+    fi
+done
+
+for NAME_LOWER in "${NAMES[@]}"; do
+    mv "media/${NAME_LOWER}/videos/examples/${RESDIR}/Example_${NAME_LOWER}.mp4" \
+        "video_output/${OUTDIR}/${NAME_LOWER}.mp4"
+done
 
+# In dev mode the media dir is kept: manim hashes every play() call and
+# reuses its partial movie files, so only edited sections are re-rendered.
+if [ "${ALGOMANIM_DEV:-0}" != "1" ]; then
+    rm -rf media
+fi
+rm -rf __pycache__
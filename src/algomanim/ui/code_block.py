@@ -110,6 +110,7 @@ class CodeBlock(CodeBlockBase):
 
         # --- highlights ---
         self._highlighted_indices = set()
+        self._highlighted_pre = False
 
         self._code_vgroup = self._create_code_vgroup()
         self._align_code_vgroup(self._code_vgroup, self._code_rect)
@@ -144,9 +145,16 @@ class CodeBlock(CodeBlockBase):
 
         Note:
             Previous highlights are cleared from lines not in the new indices.
+            Repeating the current highlight is a no-op.
         """
         new_highlighted = set(indices)
 
+        if (
+            new_highlighted == self._highlighted_indices
+            and pre == self._highlighted_pre
+        ):
+            return
+
         # --- Clear old highlights ---
         for idx in self._highlighted_indices - new_highlighted:
             if self._code_text_mobs[idx]:
@@ -162,12 +170,17 @@ class CodeBlock(CodeBlockBase):
             code_rect_highlight_color = self._code_rect_prehighlight_color
 
         # --- Apply new highlights ---
-        for idx in new_highlighted - self._highlighted_indices:
+        if pre == self._highlighted_pre:
+            to_apply = new_highlighted - self._highlighted_indices
+        else:
+            to_apply = new_highlighted
+        for idx in to_apply:
             if self._code_text_mobs[idx]:
                 self._code_text_mobs[idx].set_color(code_text_highlight_color)
                 self._code_rect_mobs[idx].set_fill_color(code_rect_highlight_color)
 
         self._highlighted_indices = new_highlighted
+        self._highlighted_pre = pre
 
 
 class CodeBlockLense(CodeBlockBase):
@@ -298,6 +311,7 @@ class CodeBlockLense(CodeBlockBase):
             self._limit = limit - 1
         # --- highlights ---
         self._highlighted_indices = set()
+        self._highlighted_pre = False
         # --- dim ---
         self._dim_high = dim_high
         self._dim_low = dim_low
@@ -434,6 +448,7 @@ class CodeBlockLense(CodeBlockBase):
             self._code_rect_mobs[idx].set_fill_color(self._code_rect_fill_color)
 
         self._highlighted_indices = set()
+        self._highlighted_pre = False
 
     def highlight(
         self,
@@ -448,6 +463,9 @@ class CodeBlockLense(CodeBlockBase):
 
         Raises:
             ValueError: If indices are not consecutive or exceed limit//2.
+
+        Note:
+            Repeating the current highlight is a no-op.
         """
 
         # --- validation ---
@@ -460,6 +478,12 @@ class CodeBlockLense(CodeBlockBase):
             raise ValueError(
                 f"Cannot highlight {len(indices)} lines, maximum is {self._limit // 2}"
             )
+        new_highlighted = set(indices)
+        if (
+            new_highlighted == self._highlighted_indices
+            and pre == self._highlighted_pre
+        ):
+            return
 
         # --- calculate new viewport ---
         start_idx = self._get_code_index_for_highlight(*indices)
@@ -471,8 +495,14 @@ class CodeBlockLense(CodeBlockBase):
         for i in range(len(self._code_vgroup)):
             self._code_vgroup[i][1].set_opacity(1.0)
 
+        # --- lines already painted in the requested mode keep their colors ---
+        if pre == self._highlighted_pre:
+            kept = self._highlighted_indices & new_highlighted
+        else:
+            kept = set()
+
         # --- clear old highlights ---
-        for idx in self._highlighted_indices:
+        for idx in self._highlighted_indices - kept:
             self._code_text_mobs[idx].set_color(self._code_text_regular_color)
             self._code_rect_mobs[idx].set_fill_color(self._code_rect_fill_color)
 
@@ -490,13 +520,14 @@ class CodeBlockLense(CodeBlockBase):
         # --- apply new highlights ---
         for i in range(len(new_code_vgroup)):
             global_idx = start_idx + i
-            if global_idx in indices:
+            if global_idx in new_highlighted and global_idx not in kept:
                 if self._code_text_mobs[global_idx]:
                     new_code_vgroup[i][1].set_color(code_text_highlight_color)
                     new_code_vgroup[i][0].set_fill_color(code_rect_highlight_color)
 
         # --- update ---
-        self._highlighted_indices = set(indices)
+        self._highlighted_indices = new_highlighted
+        self._highlighted_pre = pre
         self._position_code_vgroup(new_code_vgroup)
 
         self.remove(self._code_vgroup)
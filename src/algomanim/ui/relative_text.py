@@ -104,10 +104,9 @@ class RelativeTextValue(RelativeTextUpdatable, SingleRelativeTextMixin):
         Returns:
             Text mobject ready for positioning.
         """
-        if not isinstance(self._callable(), str):
-            val = self._callable()
-        else:
-            val = f'"{self._callable()}"'
+        val = self._callable()
+        if isinstance(val, str):
+            val = f'"{val}"'
 
         if self._equal_sign:
             if self._spaces:
@@ -614,3 +613,34 @@ class RelativeText(RelativeTextBase, SingleRelativeTextMixin):
             self.add_to_back(self._hl_rect)
         else:
             self._hl_rect = None
+
+    def set_text(self, text: str) -> None:
+        """Replace the displayed text in place.
+
+        The object keeps its positioning rules and stays on the scene, so it
+        can be reused instead of removing it and creating a new RelativeText.
+        A rebuilt highlight rectangle starts deactivated.
+
+        Args:
+            text: The new text string to visualize.
+        """
+        self.remove(self._text_mob)
+        if self._hl_rect is not None:
+            self.remove(self._hl_rect)
+
+        self._text = text
+        self._text_mob = self._create_text_mob(
+            self._text,
+            color=self._text_color,
+        )
+
+        self.add(self._text_mob)
+        self._position()
+
+        if self._hl_rect is not None:
+            self._hl_rect = HLRect(
+                self._text_mob,
+                self._get_hl_color(self._text_color),
+            )
+            self._hl_rect.deactivate()
+            self.add_to_back(self._hl_rect)
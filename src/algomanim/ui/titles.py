@@ -113,7 +113,7 @@ class TitleText(AlgoManimBase):
             undercaption_buff = 0.3
 
         # create the text mobject
-        self._text_mobject = mn.Text(
+        self._text_mobject = self._create_text(
             text,
             font=font,
             font_size=font_size,
@@ -140,7 +140,7 @@ class TitleText(AlgoManimBase):
         # optionally create the undercaption under the text
         if undercaption_text:
             # create the text mobject
-            undercaption_text_mob = mn.Text(
+            undercaption_text_mob = self._create_text(
                 undercaption_text,
                 font=undercaption_font,
                 font_size=undercaption_font_size,
@@ -303,7 +303,7 @@ class TitleLogo(AlgoManimBase):
 
         # create the text mobject
         if text:
-            self.text_mobject = mn.Text(
+            self.text_mobject = self._create_text(
                 text,
                 font=font,
                 font_size=font_size,
@@ -0,0 +1,49 @@
+import numpy as np
+import manim as mn
+from algomanim.core.base import AlgoManimBase, _build_text
+
+create_text = AlgoManimBase._create_text
+
+
+def hex_of(color) -> str:
+    return mn.ManimColor(color).to_hex()
+
+
+# ---- _create_text cache ----
+
+
+def test_create_text_returns_copy():
+    config = {"font_size": 20, "color": mn.WHITE}
+    text_1 = create_text("42", **config)
+    text_2 = create_text("42", **config)
+    template = _build_text("42", tuple(sorted(config.items())))
+
+    assert text_1 is not template
+    assert text_2 is not template
+    assert text_1 is not text_2
+
+
+def test_create_text_copy_leaves_template_unchanged():
+    config = {"font_size": 21, "color": mn.WHITE}
+    template = _build_text("7", tuple(sorted(config.items())))
+    center = template.get_center().copy()
+
+    text = create_text("7", **config)
+    text.set_color(mn.RED)
+    text.shift(mn.RIGHT * 3)
+
+    assert hex_of(template.get_color()) == hex_of(mn.WHITE)
+    assert np.allclose(template.get_center(), center)
+
+    fresh = create_text("7", **config)
+    assert hex_of(fresh.get_color()) == hex_of(mn.WHITE)
+    assert np.allclose(fresh.get_center(), center)
+
+
+def test_create_text_unhashable_config_falls_back():
+    currsize = _build_text.cache_info().currsize
+
+    text = create_text("ab", font_size=20, t2c={"a": mn.RED})
+
+    assert isinstance(text, mn.Text)
+    assert _build_text.cache_info().currsize == currsize
@@ -0,0 +1,37 @@
+import pytest
+import manim as mn
+from algomanim.ui.code_block import CodeBlock, CodeBlockLense
+
+
+def hex_of(color) -> str:
+    return mn.ManimColor(color).to_hex()
+
+
+CODE = """
+def f(a):
+    for x in a:
+        if x:
+            return x
+    return None
+"""
+
+LONG_CODE = "\n" + "\n".join(f"line_{i} = {i}" for i in range(20))
+
+
+def test_code_block_pre_switch_recolors():
+    cb = CodeBlock(CODE)
+    cb.highlight(1, 2)
+    cb.highlight(1, 2, pre=True)
+
+    for i in (1, 2):
+        assert hex_of(cb._code_text_mobs[i].get_color()) == hex_of(
+            cb._code_text_prehighlight_color
+        )
+
+
+def test_code_block_lense_validates_repeated_highlight():
+    cb = CodeBlockLense(LONG_CODE, limit=7)
+    cb.highlight(4, 5)
+
+    with pytest.raises(ValueError):
+        cb.highlight(5, 4)
@@ -0,0 +1,101 @@
+import pytest
+import manim as mn
+from algomanim.core.linear_container import LinearContainerStructure
+from algomanim.datastructures.array import Array
+
+changed = LinearContainerStructure._changed_color_keys
+
+
+def hex_of(color) -> str:
+    return mn.ManimColor(color).to_hex()
+
+
+# ---- value colors mode ----
+
+
+def test_deactivate_value_mode_then_highlight():
+    scene = mn.Scene()
+    data = [1, 2, 3]
+    fill_color = mn.DARK_GRAY
+    text_color = mn.WHITE
+    arr = Array(lambda: data, fill_color=fill_color, text_color=text_color)
+
+    arr.activate_value_colors_mode({2: [mn.PURPLE, mn.YELLOW], 3: [mn.ORANGE, mn.RED]})
+    arr.update_value(scene, animate=False)
+    assert hex_of(arr._containers_mob[1].get_fill_color()) == hex_of(mn.PURPLE)
+
+    arr.deactivate_value_colors_mode()
+    arr.highlight_containers(0, color_1=mn.BLUE)
+
+    assert hex_of(arr._containers_mob[0].get_fill_color()) == hex_of(mn.BLUE)
+    for i in (1, 2):
+        assert hex_of(arr._containers_mob[i].get_fill_color()) == hex_of(fill_color)
+        assert hex_of(arr._values_mob[i].get_color()) == hex_of(text_color)
+
+
+# ---- _changed_color_keys ----
+
+
+def test_changed_keys_equal_str():
+    assert changed({0: "#FC6255"}, {0: "#FC6255"}) == set()
+
+
+def test_changed_keys_equal_manim():
+    assert changed({0: mn.RED}, {0: mn.ManimColor("#FC6255")}) == set()
+
+
+def test_changed_keys_same_object():
+    assert changed({0: mn.RED, 1: "#FC6255"}, {0: mn.RED, 1: "#FC6255"}) == set()
+
+
+def test_changed_keys_str_vs_manim():
+    assert changed({0: "#FC6255"}, {0: mn.RED}) == {0}
+
+
+def test_changed_keys_different_color():
+    assert changed({0: mn.RED, 1: "#58C4DD"}, {0: mn.BLUE, 1: "#58C4DD"}) == {0}
+
+
+def test_changed_keys_missing():
+    assert changed({0: mn.RED, 1: mn.BLUE}, {1: mn.BLUE, 2: mn.GREEN}) == {0, 2}
+
+
+def test_repeated_highlight_repaints_nothing():
+    arr = Array(lambda: [1, 2, 3])
+    arr.highlight_containers(0, 1, color_1=mn.BLUE)
+    arr._containers_mob[0].set_fill(mn.PINK)
+
+    arr.highlight_containers(0, 1, color_1=mn.BLUE)
+
+    assert hex_of(arr._containers_mob[0].get_fill_color()) == hex_of(mn.PINK)
+
+
+# ---- highlight_containers_and_pointers ----
+
+
+def test_containers_and_pointers_paints_both():
+    arr = Array(lambda: [1, 2, 3])
+    arr.highlight_containers_and_pointers(0, 2, color_1=mn.BLUE, color_2=mn.GREEN)
+
+    assert arr._containers_colors == {0: mn.BLUE, 2: mn.GREEN}
+    assert set(arr._top_pointers_colors) == {0, 2}
+
+
+def test_containers_and_pointers_rejects_value_mode():
+    arr = Array(lambda: [1, 2, 3], value_colors_map={2: [mn.PURPLE, mn.YELLOW]})
+
+    with pytest.raises(RuntimeError):
+        arr.highlight_containers_and_pointers(0)
+
+    assert arr._containers_colors == {}
+    assert arr._top_pointers_colors == {}
+
+
+def test_containers_and_pointers_validates_before_painting():
+    arr = Array(lambda: [1, 2, 3, 4, 5], pointers_mode=3)
+
+    with pytest.raises(ValueError):
+        arr.highlight_containers_and_pointers(0, 1, 2, 3)
+
+    assert arr._containers_colors == {}
+    assert arr._top_pointers_colors == {}
@@ -0,0 +1,29 @@
+import pytest
+import manim as mn
+from algomanim.core.node_structure import _fit_font_size
+
+
+def fit_font_size_loop(max_height: float, min_font_size: int = 10) -> int:
+    """Reference: the incremental search _fit_font_size replaced."""
+    font_size = min_font_size
+    while mn.Text("0", font_size=font_size).height < max_height:
+        font_size += 1
+    return font_size
+
+
+@pytest.mark.parametrize("radius", [0.3, 0.5, 0.75, 1.0])
+def test_fit_font_size_matches_loop(radius):
+    max_height = radius  # (radius - radius / 2) * 2, as in NodeStructure
+    assert _fit_font_size(max_height) == fit_font_size_loop(max_height)
+
+
+def test_fit_font_size_is_smallest():
+    max_height = 0.5
+    font_size = _fit_font_size(max_height)
+
+    assert mn.Text("0", font_size=font_size).height >= max_height
+    assert mn.Text("0", font_size=font_size - 1).height < max_height
+
+
+def test_fit_font_size_min_bound():
+    assert _fit_font_size(0.0) == 10
@@ -0,0 +1,51 @@
+import numpy as np
+import manim as mn
+from algomanim.core.paths.hl_rect import HLRect
+from algomanim.ui.relative_text import RelativeText
+
+
+def hex_of(color) -> str:
+    return mn.ManimColor(color).to_hex()
+
+
+def test_set_text_replaces_text_and_keeps_position():
+    scene = mn.Scene()
+    anchor = mn.Square(side_length=1).shift(mn.LEFT * 3)
+    rt = RelativeText("short", align_left=anchor, vector=mn.UP)
+    scene.add(rt)
+    old_text_mob = rt._text_mob
+
+    rt.set_text("a much longer text")
+
+    assert rt._text == "a much longer text"
+    assert rt._text_mob is not old_text_mob
+    assert rt._text_mob in rt.submobjects
+    assert old_text_mob not in rt.submobjects
+    assert rt._text_mob.width > old_text_mob.width
+    assert np.isclose(rt._text_mob.get_left()[0], anchor.get_left()[0])
+    assert np.isclose(rt._text_mob.get_center()[1], 1.0)
+    assert rt in scene.mobjects
+
+
+def test_set_text_rebuilds_deactivated_hl_rect():
+    rt = RelativeText("short")
+    old_hl_rect = rt._hl_rect
+    old_hl_rect.activate()
+
+    rt.set_text("a much longer text")
+
+    assert isinstance(rt._hl_rect, HLRect)
+    assert rt._hl_rect is not old_hl_rect
+    assert old_hl_rect not in rt.submobjects
+    assert rt.submobjects[0] is rt._hl_rect
+    assert rt._hl_rect.width >= rt._text_mob.width
+    for layer in rt._hl_rect:
+        assert hex_of(layer.get_fill_color()) == hex_of(rt._hl_rect._bg_color)
+
+
+def test_set_text_without_hl():
+    rt = RelativeText("short", hl=False)
+    rt.set_text("other")
+
+    assert rt._hl_rect is None
+    assert rt.submobjects == [rt._text_mob]